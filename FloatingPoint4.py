@@ -13,6 +13,11 @@ from tkinter import ttk
 import struct
 import random
 from decimal import Decimal, getcontext
+from fractions import Fraction
+from functools import lru_cache
+
+from item_analysis import ItemAnalysis, FLOAT_ITEMS, FLOAT_LOG, show_report
+from quiz_prefetch import QuizPrefetcher
 
 getcontext().prec = 50  # High precision for decimal conversion
 
@@ -121,6 +126,169 @@ def gen_mul_operands_easy():
     return s, E, F
 
 
+# ---------------- Whole quiz ----------------
+def gen_quiz_operands():
+    """Random operand bits for the three sections: (S, E, F), (sA, EA, FA, sB, EB, FB) x 2."""
+    s1 = gen_1_1_bits()
+    s2 = gen_mul_operands_easy() + gen_mul_operands_easy()
+    sA2, EA2, FA2 = gen_mul_add_operands()
+    sB2, EB2, FB2 = gen_mul_add_operands()
+    EA2 = random.choice([127,128,129])
+    EB2 = max(2, min(253, EA2 + random.choice([-1,0,1])))
+    s3 = (sA2, EA2, FA2, sB2, EB2, FB2)
+    return s1, s2, s3
+
+def build_quiz(operands):
+    """
+    Everything the GUI shows for one quiz, computed from its operands:
+    {'operands', 'labels' (one per section), 'answers' (10 strings)}.
+    The formatted 1.1 answer is left to trace_representation, shown on request.
+    Safe to call off the Tk thread.
+    """
+    (S1, E1, F1), (sA, EA, FA, sB, EB, FB), (sA2, EA2, FA2, sB2, EB2, FB2) = operands
+
+    # 1.1
+    val1 = make_float_from_bits(S1, E1, F1)
+    s_sign, d_first, m_frac, e10, _ = decimal_scientific_components(val1, 6)
+
+    # 1.2 multiply
+    A = make_float_from_bits(sA, EA, FA)
+    B = make_float_from_bits(sB, EB, FB)
+    R = struct.unpack(">f", struct.pack(">f", A * B))[0]
+    sR, ER, FR = float_to_bits(R)
+
+    # 1.3 addition
+    A2 = make_float_from_bits(sA2, EA2, FA2)
+    B2 = make_float_from_bits(sB2, EB2, FB2)
+    R2 = struct.unpack(">f", struct.pack(">f", A2 + B2))[0]
+    sR2, ER2, FR2 = float_to_bits(R2)
+
+    return quiz_from_answers(operands, [
+        str(s_sign), str(d_first), str(m_frac), str(e10),
+        str(sR), str(ER), leftmost_F_bits(FR,6),
+        str(sR2), str(ER2), leftmost_F_bits(FR2,6),
+    ])
+
+def quiz_from_answers(operands, answers):
+    """The quiz dict from operands and already known answers (formatting only, e.g. from quiz_pool)."""
+    (S1, E1, F1), (sA, EA, FA, sB, EB, FB), (sA2, EA2, FA2, sB2, EB2, FB2) = operands
+    return {
+        'operands': operands,
+        'labels': (
+            f"Given bits: S={S1}, E={E1} (dec), F={F1 >> 17:06b}...0",
+            f"A: S={sA} E={EA} F={FA >> 17:06b}...0\n"
+            f"B: S={sB} E={EB} F={FB >> 17:06b}...0",
+            f"A: S={sA2} E={EA2} F={FA2 >> 17:06b}...0\n"
+            f"B: S={sB2} E={EB2} F={FB2 >> 17:06b}...0",
+        ),
+        'answers': answers,
+    }
+
+def generate_quiz():
+    return build_quiz(gen_quiz_operands())
+
+
+# ---------------- Worked solutions ----------------
+TRACE_CACHE_SIZE = 256  # rendered traces kept per section, keyed by operand bits
+
+def significand(F):
+    """Exact value of 1.F as a Fraction."""
+    return Fraction((1 << 23) | F, 1 << 23)
+
+def binary_fixed(value):
+    """Binary fixed-point text of a non-negative dyadic Fraction, e.g. 10.01 for 2.25."""
+    whole = int(value)
+    frac = value - whole
+    bits = ""
+    while frac and len(bits) < 48:
+        frac *= 2
+        bits += "1" if frac >= 1 else "0"
+        frac -= int(frac)
+    return f"{whole:b}.{bits or '0'}"
+
+def expand_significand(F):
+    """'1.F = 1.11 = 1 + 2^-1 + 2^-2 = 1.75'"""
+    bits = f"{F:023b}".rstrip("0")
+    terms = ["1"] + [f"2^-{i + 1}" for i, b in enumerate(bits) if b == "1"]
+    return f"1.F = 1.{bits or '0'} = {' + '.join(terms)} = {float(significand(F))}"
+
+def result_fields(R):
+    s, E, F = float_to_bits(R)
+    return f"R: S = {s}, E = {E} = {E_to_8bit(E)}, F = {F:023b} → left 6 bits {leftmost_F_bits(F, 6)}"
+
+@lru_cache(maxsize=TRACE_CACHE_SIZE)
+def trace_representation(s, E, F):
+    val = make_float_from_bits(s, E, F)
+    formatted = decimal_scientific_components(val, 6)[4]
+    return "\n".join([
+        expand_significand(F),
+        f"Exponent: E - 127 = {E} - 127 = {E - 127}",
+        f"N = (-1)^{s} * {float(significand(F))} * 2^{E - 127} = {Decimal(val):f}",
+        f"Scientific: {formatted}",
+    ])
+
+@lru_cache(maxsize=TRACE_CACHE_SIZE)
+def trace_multiply(sA, EA, FA, sB, EB, FB):
+    mA, mB = significand(FA), significand(FB)
+    product = mA * mB
+    E = EA + EB - 127
+    lines = [
+        f"Sign: S = SA xor SB = {sA} xor {sB} = {sA ^ sB}",
+        f"Exponent: EA + EB - 127 = {EA} + {EB} - 127 = {E}",
+        f"Significands: {binary_fixed(mA)} * {binary_fixed(mB)} = {binary_fixed(product)} "
+        f"({float(mA)} * {float(mB)} = {float(product)})",
+    ]
+    if product >= 2:
+        lines.append(f"Normalize: {binary_fixed(product)} >= 2, shift right 1 → "
+                     f"{binary_fixed(product / 2)}, E = {E} + 1 = {E + 1}")
+    else:
+        lines.append("Normalize: already in [1, 2), no shift")
+    R = struct.unpack(">f", struct.pack(">f", make_float_from_bits(sA, EA, FA) * make_float_from_bits(sB, EB, FB)))[0]
+    lines.append(f"Decimal: R = {Decimal(R):f}")
+    lines.append(result_fields(R))
+    return "\n".join(lines)
+
+@lru_cache(maxsize=TRACE_CACHE_SIZE)
+def trace_add(sA, EA, FA, sB, EB, FB):
+    # Operand with the larger magnitude first, so the result takes its sign
+    big, small = sorted([(sA, EA, FA, "A"), (sB, EB, FB, "B")], key=lambda o: (o[1], o[2]), reverse=True)
+    s1, E1, F1, n1 = big
+    s2, E2, F2, n2 = small
+    m1, m2 = significand(F1), significand(F2)
+    shift = E1 - E2
+    m2_aligned = m2 / (1 << shift)
+    lines = []
+    if shift:
+        lines.append(f"Align: E{n1} = {E1}, E{n2} = {E2} → shift {n2}'s significand right {shift}: "
+                     f"{binary_fixed(m2)} → {binary_fixed(m2_aligned)}")
+    else:
+        lines.append(f"Align: EA = EB = {E1}, no shift")
+    if s1 == s2:
+        total = m1 + m2_aligned
+        lines.append(f"Signs equal → add: {binary_fixed(m1)} + {binary_fixed(m2_aligned)} = {binary_fixed(total)}")
+    else:
+        total = m1 - m2_aligned
+        step = (f"Signs differ → subtract smaller magnitude ({n2}) from larger ({n1}): "
+                f"{binary_fixed(m1)} - {binary_fixed(m2_aligned)} = {binary_fixed(total)}")
+        # An exact cancellation has no larger operand to take the sign from
+        lines.append(step if total == 0 else f"{step}, S = S{n1} = {s1}")
+    if total == 0:
+        lines.append("Normalize: result is exactly zero, +0 under round-to-nearest (S = 0)")
+    elif total >= 2:
+        lines.append(f"Normalize: shift right 1 → {binary_fixed(total / 2)}, E = {E1} + 1 = {E1 + 1}")
+    elif total < 1:
+        k = 0
+        while total * (1 << k) < 1:
+            k += 1
+        lines.append(f"Normalize: shift left {k} → {binary_fixed(total * (1 << k))}, E = {E1} - {k} = {E1 - k}")
+    else:
+        lines.append("Normalize: already in [1, 2), no shift")
+    R = struct.unpack(">f", struct.pack(">f", make_float_from_bits(sA, EA, FA) + make_float_from_bits(sB, EB, FB)))[0]
+    lines.append(f"Decimal: R = {Decimal(R):f}")
+    lines.append(result_fields(R))
+    return "\n".join(lines)
+
+
 # ---------------- GUI ----------------
 LARGE_FONT = ("Arial", 14)
 TITLE_FONT = ("Arial", 16, "bold")
@@ -128,10 +296,13 @@ SECTION_PADX = 12
 SECTION_PADY = 12
 
 class FloatQuizApp:
-    def __init__(self, root):
+    def __init__(self, root, generate=generate_quiz):
+        """generate() returns the next quiz, e.g. quiz_pool.QuizPool(path).random_quiz."""
         self.root = root
-        root.title("IEEE-754 Floating Point Quiz — Light Academic Theme")
-        root.geometry("1100x850")
+        # root may also be a tab frame in quiz_launcher, which owns the window title
+        if isinstance(root, (tk.Tk, tk.Toplevel)):
+            root.title("IEEE-754 Floating Point Quiz — Light Academic Theme")
+            root.geometry("1100x850")
 
         main = ttk.Frame(root)
         main.pack(fill="both", expand=True)
@@ -144,7 +315,8 @@ class FloatQuizApp:
         self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         self.container.bind("<Configure>", self.update_scroll)
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Grab the wheel whenever the pointer enters, so several quizzes can share one root
+        self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel))
 
         title = ttk.Label(self.container, text="IEEE-754 Floating Point Quiz", font=TITLE_FONT, background="white")
         title.pack(pady=(16,8))
@@ -160,6 +332,10 @@ class FloatQuizApp:
 
         self.entries = []
         self.correct_answers = []
+        self.analysis = ItemAnalysis(FLOAT_ITEMS, FLOAT_LOG)
+        self.attempt_open = False  # True until the current quiz is first checked or revealed
+        self.quiz_ready = False    # False between New Quiz and the prefetched quiz being applied
+        self.prefetcher = QuizPrefetcher(generate)
 
         self._build_section1()
         self._build_section2()
@@ -170,6 +346,7 @@ class FloatQuizApp:
         ttk.Button(btn_frame, text="✅ Check Answers", command=self.check_answers).pack(side="left", padx=10, pady=6)
         ttk.Button(btn_frame, text="🔄 New Quiz", command=self.new_quiz).pack(side="left", padx=10, pady=6)
         ttk.Button(btn_frame, text="🛈 Show Correct Answers", command=self.show_answers).pack(side="left", padx=10, pady=6)
+        ttk.Button(btn_frame, text="📊 Item Statistics", command=lambda: show_report(self.root, self.analysis)).pack(side="left", padx=10, pady=6)
 
 
         self.result_label = ttk.Label(self.container, text="", font=("Arial", 14, "bold"), background="white")
@@ -211,7 +388,7 @@ class FloatQuizApp:
         e_e = ttk.Entry(row, width=8, font=LARGE_FONT)
         e_e.pack(side="left", padx=(6,6))
         self.entries += [{'widget': e_s, 'corr': None},{'widget': e_d, 'corr': None},{'widget': e_m, 'corr': None},{'widget': e_e, 'corr': None}]
-        self.s1_hint = tk.Label(self.section1, text="", font=("Arial", 12), fg="darkgreen", background="white")
+        self.s1_hint = tk.Label(self.section1, text="", font=("Arial", 12), fg="darkgreen", justify="left", background="white")
         self.s1_hint.pack(anchor="w", padx=12, pady=(4,8))
 
     def _build_section2(self):
@@ -234,7 +411,7 @@ class FloatQuizApp:
         e_F = ttk.Entry(row, width=10, font=LARGE_FONT)
         e_F.pack(side="left", padx=(6,6))
         self.entries += [{'widget': e_S, 'corr': None},{'widget': e_E, 'corr': None},{'widget': e_F, 'corr': None}]
-        self.s2_hint = tk.Label(self.section2, text="", font=("Arial", 12), fg="darkgreen", background="white")
+        self.s2_hint = tk.Label(self.section2, text="", font=("Arial", 12), fg="darkgreen", justify="left", background="white")
         self.s2_hint.pack(anchor="w", padx=12, pady=(4,8))
 
     def _build_section3(self):
@@ -257,21 +434,25 @@ class FloatQuizApp:
         e_F = ttk.Entry(row, width=10, font=LARGE_FONT)
         e_F.pack(side="left", padx=(6,6))
         self.entries += [{'widget': e_S, 'corr': None},{'widget': e_E, 'corr': None},{'widget': e_F, 'corr': None}]
-        self.s3_hint = tk.Label(self.section3, text="", font=("Arial", 12), fg="darkgreen", background="white")
+        self.s3_hint = tk.Label(self.section3, text="", font=("Arial", 12), fg="darkgreen", justify="left", background="white")
         self.s3_hint.pack(anchor="w", padx=12, pady=(4,8))
 
     def show_answers(self):
+        if not self.quiz_ready:
+            return
+        # Checks after the answers were revealed do not count as a response
+        self.attempt_open = False
         # Section 1
         s1_text = f"s = {self.entries[0]['corr']}, d = {self.entries[1]['corr']}, m = {self.entries[2]['corr']}, e = {self.entries[3]['corr']}"
-        self.s1_hint.config(text=f"Correct: {s1_text}")
+        self.s1_hint.config(text=f"Correct: {s1_text}\n{trace_representation(*self.s1_operands)}")
 
         # Section 2
         s2_text = f"S = {self.entries[4]['corr']}, E = {self.entries[5]['corr']}, F (left 6 bits) = {self.entries[6]['corr']}"
-        self.s2_hint.config(text=f"Correct: {s2_text}")
+        self.s2_hint.config(text=f"Correct: {s2_text}\n{trace_multiply(*self.s2_operands)}")
 
         # Section 3
         s3_text = f"S = {self.entries[7]['corr']}, E = {self.entries[8]['corr']}, F (left 6 bits) = {self.entries[9]['corr']}"
-        self.s3_hint.config(text=f"Correct: {s3_text}")
+        self.s3_hint.config(text=f"Correct: {s3_text}\n{trace_add(*self.s3_operands)}")
 
         # Also color all entries green for clarity
         for e in self.entries:
@@ -295,66 +476,54 @@ class FloatQuizApp:
             e['widget'].delete(0, 'end')
             e['widget'].config(foreground='black')
 
-        # 1.1
-        S1, E1, F1 = gen_1_1_bits()
-        val1 = make_float_from_bits(S1, E1, F1)
-        s_sign, d_first, m_frac, e10, formatted = decimal_scientific_components(val1, 6)
-        self.s1_bits_label.config(text=f"Given bits: S={S1}, E={E1} (dec), F={F1 >> 17:06b}...0")
-        idx = 0
-        self.entries[idx]['corr'] = str(s_sign)
-        self.entries[idx+1]['corr'] = str(d_first)
-        self.entries[idx+2]['corr'] = str(m_frac)
-        self.entries[idx+3]['corr'] = str(e10)
-        self.s1_hint.config(text=f"(Example correct formatting) {formatted}")
-
-        # 1.2 multiply
-        sA, EA, FA = gen_mul_operands_easy()
-        sB, EB, FB = gen_mul_operands_easy()
-        A = make_float_from_bits(sA, EA, FA)
-        B = make_float_from_bits(sB, EB, FB)
-        R = struct.unpack(">f", struct.pack(">f", A * B))[0]
-        sR, ER, FR = float_to_bits(R)
-        self.s2_bits_label.config(
-        text=f"A: S={sA} E={EA} F={FA >> 17:06b}...0\n"
-             f"B: S={sB} E={EB} F={FB >> 17:06b}...0")
-        idx = 4
-        self.entries[idx]['corr'] = str(sR)
-        self.entries[idx+1]['corr'] = str(ER)
-        self.entries[idx+2]['corr'] = leftmost_F_bits(FR,6)
-        self.s2_hint.config(text=f"(Correct numeric R ≈ {R!r})")
-
-        # 1.3 addition
-        sA2, EA2, FA2 = gen_mul_add_operands()
-        sB2, EB2, FB2 = gen_mul_add_operands()
-        EA2 = random.choice([127,128,129])
-        EB2 = max(2, min(253, EA2 + random.choice([-1,0,1])))
-        A2 = make_float_from_bits(sA2, EA2, FA2)
-        B2 = make_float_from_bits(sB2, EB2, FB2)
-        R2 = struct.unpack(">f", struct.pack(">f", A2 + B2))[0]
-        sR2, ER2, FR2 = float_to_bits(R2)
-        self.s3_bits_label.config(
-        text=f"A: S={sA2} E={EA2} F={FA2 >> 17:06b}...0\n"
-             f"B: S={sB2} E={EB2} F={FB2 >> 17:06b}...0")
-        idx = 7
-        self.entries[idx]['corr'] = str(sR2)
-        self.entries[idx+1]['corr'] = str(ER2)
-        self.entries[idx+2]['corr'] = leftmost_F_bits(FR2,6)
-        self.s3_hint.config(text=f"(Correct numeric R ≈ {R2!r})")
+        # Until _apply_quiz runs, the operands and answers still belong to the old quiz
+        self.quiz_ready = False
+        self.attempt_open = False
+
+        # Generation runs on the prefetch worker; here we only apply the result
+        self.prefetcher.get(self.root, self._apply_quiz)
+
+    def _apply_quiz(self, quiz):
+        self.quiz_ready = True
+        self.attempt_open = True
+        self.s1_operands, self.s2_operands, self.s3_operands = quiz['operands']
+        for label, text in zip((self.s1_bits_label, self.s2_bits_label, self.s3_bits_label), quiz['labels']):
+            label.config(text=text)
+        for e, corr in zip(self.entries, quiz['answers']):
+            e['corr'] = corr
 
     def check_answers(self):
+        if not self.quiz_ready:
+            return
         total = len(self.entries)
         correct = 0
+        scores = []
+        choices = []
         for e in self.entries:
             user = e['widget'].get().strip()
             corr = str(e['corr']).strip()
+            scores.append(1 if user == corr else 0)
+            choices.append(user or None)
             if user == corr:
                 e['widget'].config(foreground='green')
                 correct += 1
             else:
                 e['widget'].config(foreground='red')
         self.result_label.config(text=f"Score: {correct}/{total} ({correct/total*100:.1f}%)")
+        # Only the first check of a quiz is a response; re-checks would count the student again
+        if self.attempt_open:
+            self.attempt_open = False
+            self.analysis.record(scores, choices)
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="IEEE-754 floating point quiz.")
+    parser.add_argument("--pool", metavar="PATH", help="serve quizzes from a 'float' quiz pool (see quiz_pool.py)")
+    args = parser.parse_args()
+    generate = generate_quiz
+    if args.pool:
+        from quiz_pool import QuizPool
+        generate = QuizPool(args.pool, kind="float").random_quiz
     root = tk.Tk()
-    app = FloatQuizApp(root)
+    app = FloatQuizApp(root, generate=generate)
     root.mainloop()
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk
 import random
 
+from item_analysis import ItemAnalysis, MIPS_LOG, question_item_name, show_report
+
 # --- Frågor och svar ---
 questions = [
     {
@@ -160,52 +162,21 @@ for q in questions:
     q["options"] = [o for o, _ in opts]
     q["answer"] = [i for i, (_, c) in enumerate(opts) if c][0]
 
-# --- GUI ---
-root = tk.Tk()
-root.title("MIPS Quiz")
-root.geometry("1000x800")
-
-main_frame = ttk.Frame(root)
-main_frame.pack(fill="both", expand=True)
-
-canvas = tk.Canvas(main_frame)
-scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-scrollable_frame = ttk.Frame(canvas)
-
-scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-canvas.configure(yscrollcommand=scrollbar.set)
-
-canvas.pack(side="left", fill="both", expand=True)
-scrollbar.pack(side="right", fill="y")
-
-# ✅ Enable scrollwheel support
-def _on_mouse_wheel(event):
-    canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-canvas.bind_all("<MouseWheel>", _on_mouse_wheel)
-
-selected_answers = []
-result_labels = []
-
-for i, q in enumerate(questions):
-    ttk.Label(scrollable_frame, text=q["question"], font=("Arial", 12, "bold"),
-              wraplength=900, justify="left").pack(anchor="w", pady=(10, 0))
-    var = tk.IntVar(value=-1)
-    selected_answers.append(var)
-    for j, opt in enumerate(q["options"]):
-        ttk.Radiobutton(scrollable_frame, text=opt, variable=var,
-                        value=j).pack(anchor="w", padx=20)
-    result_label = ttk.Label(scrollable_frame, text="")
-    result_label.pack(anchor="w")
-    result_labels.append(result_label)
+# Item statistics, keyed by option text so they survive the shuffling
+analysis = ItemAnalysis([question_item_name(q) for q in questions], MIPS_LOG)
+recorded = False  # the quiz is recorded on its first check only
 
 # ✅ Score display with format "(X/Y)"
 def check_answers():
+    global recorded
     score = 0
+    scores = []
+    choices = []
     for i, q in enumerate(questions):
         selected = selected_answers[i].get()
         correct = q["answer"]
+        scores.append(1 if selected == correct else 0)
+        choices.append(q["options"][selected] if selected >= 0 else None)
         if selected == correct:
             result_labels[i].config(text="✅ Correct!", foreground="green")
             score += 1
@@ -215,9 +186,64 @@ def check_answers():
                 foreground="red"
             )
     result_label_total.config(text=f"Score: {score}/{len(questions)} ✅", font=("Arial", 16, "bold"))
+    if not recorded:
+        recorded = True
+        analysis.record(scores, choices)
+
+# --- GUI ---
+selected_answers = []
+result_labels = []
+
+def build_ui(parent):
+    """Build the quiz inside parent (a Tk root or a launcher tab)."""
+    global result_label_total, recorded
+
+    # check_answers reads these, so they must only hold this build's widgets
+    selected_answers.clear()
+    result_labels.clear()
+    recorded = False
+
+    main_frame = ttk.Frame(parent)
+    main_frame.pack(fill="both", expand=True)
+
+    canvas = tk.Canvas(main_frame)
+    scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
+    scrollable_frame = ttk.Frame(canvas)
+
+    scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+    canvas.configure(yscrollcommand=scrollbar.set)
+
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+
+    # ✅ Enable scrollwheel support (re-grabbed on enter, the launcher has other scrolling tabs)
+    def _on_mouse_wheel(event):
+        canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+    canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mouse_wheel))
+
+    for i, q in enumerate(questions):
+        ttk.Label(scrollable_frame, text=q["question"], font=("Arial", 12, "bold"),
+                  wraplength=900, justify="left").pack(anchor="w", pady=(10, 0))
+        var = tk.IntVar(value=-1)
+        selected_answers.append(var)
+        for j, opt in enumerate(q["options"]):
+            ttk.Radiobutton(scrollable_frame, text=opt, variable=var,
+                            value=j).pack(anchor="w", padx=20)
+        result_label = ttk.Label(scrollable_frame, text="")
+        result_label.pack(anchor="w")
+        result_labels.append(result_label)
+
+    ttk.Button(scrollable_frame, text="Rätta", command=check_answers).pack(pady=10)
+    ttk.Button(scrollable_frame, text="📊 Statistik", command=lambda: show_report(parent, analysis)).pack(pady=(0, 10))
+    result_label_total = ttk.Label(scrollable_frame, text="", font=("Arial", 14))
+    result_label_total.pack(pady=10)
 
-ttk.Button(scrollable_frame, text="Rätta", command=check_answers).pack(pady=10)
-result_label_total = ttk.Label(scrollable_frame, text="", font=("Arial", 14))
-result_label_total.pack(pady=10)
 
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("MIPS Quiz")
+    root.geometry("1000x800")
+    build_ui(root)
+    root.mainloop()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+item_analysis.py
+
+Classical test statistics for the quiz items (MIPS multiple-choice questions and
+the IEEE-754 answer fields): difficulty index, point-biserial discrimination,
+distractor selection frequencies and Cronbach's alpha.
+
+ItemAnalysis updates everything in a single pass as responses arrive
+(Welford-style running means and co-moments) and, given a log path, appends every
+response to a JSON-lines file. batch_statistics() recomputes the same numbers
+from such a log (see load_log) with numpy, which is only needed for batch mode.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import logging
+from collections import Counter
+
+log = logging.getLogger(__name__)
+
+
+def response_log_path(name):
+    """Path for a response log in a per-user data directory (the working directory may be read-only)."""
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "quizzes", name)
+
+
+FLOAT_LOG = response_log_path("float_responses.jsonl")
+MIPS_LOG = response_log_path("mips_responses.jsonl")
+
+# ---------------- Item names ----------------
+FLOAT_ITEMS = [
+    "1.1 s", "1.1 d", "1.1 m", "1.1 e",
+    "1.2 S", "1.2 E", "1.2 F",
+    "1.3 S", "1.3 E", "1.3 F",
+]
+
+
+def question_item_name(question):
+    """Short item name for a MIPS question, e.g. '5.1' (the leading number of its text)."""
+    return question["question"].split(" ", 1)[0].rstrip(".")
+
+
+# ---------------- Streaming engine ----------------
+class ItemAnalysis:
+    """
+    Single-pass item statistics.
+
+    Every call to record() takes one student's response: a 0/1 score and the
+    chosen option for each item. Scores are kept as running means and
+    co-moments against the total score, so memory does not grow with the
+    number of responses.
+
+    With log_path, every new response is appended to the log. The responses
+    already in it are only replayed by load_history() (when the statistics are
+    shown), so building a quiz does not depend on the size of the log.
+    """
+
+    def __init__(self, items, log_path=None):
+        self.items = list(items)
+        self.log_path = log_path
+        self.history_loaded = log_path is None
+        self.unlogged = []  # responses that could not be appended to the log
+        self._reset()
+
+    def _reset(self):
+        k = len(self.items)
+        self.n = 0
+        self.mean_total = 0.0
+        self.m2_total = 0.0
+        self.mean = [0.0] * k    # item difficulty (proportion correct)
+        self.m2 = [0.0] * k      # sum of squared deviations of item score
+        self.co = [0.0] * k      # co-moment of item score and total score
+        self.choices = [Counter() for _ in range(k)]
+
+    def record(self, scores, choices=None):
+        """
+        Add one response. scores is a sequence of 0/1 (one per item), choices an
+        optional sequence of chosen options (None for a blank answer).
+        A log that cannot be written is reported and otherwise ignored.
+        """
+        self._update(scores, choices)
+        if self.log_path is None:
+            return
+        entry = {"time": time.time(), "items": self.items,
+                 "scores": list(scores), "choices": None if choices is None else list(choices)}
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.log_path)), exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError:
+            log.exception("could not append to response log %s", self.log_path)
+            self.unlogged.append((entry["scores"], entry["choices"]))
+
+    def load_history(self):
+        """
+        Replace the statistics with those of the whole log (which includes this
+        session's responses) plus the responses that could not be logged. Done once.
+        """
+        if self.history_loaded:
+            return
+        self.history_loaded = True
+        scores, choices = load_log(self.log_path, self.items)
+        self._reset()
+        for sc, ch in zip(scores, choices):
+            self._update(sc, ch)
+        for sc, ch in self.unlogged:
+            self._update(sc, ch)
+
+    def _update(self, scores, choices):
+        if len(scores) != len(self.items):
+            raise ValueError(f"expected {len(self.items)} scores, got {len(scores)}")
+        self.n += 1
+        n = self.n
+        total = sum(scores)
+        d_total = total - self.mean_total
+        self.mean_total += d_total / n
+        self.m2_total += d_total * (total - self.mean_total)
+        for i, x in enumerate(scores):
+            dx = x - self.mean[i]
+            self.mean[i] += dx / n
+            self.m2[i] += dx * (x - self.mean[i])
+            self.co[i] += dx * (total - self.mean_total)
+        if choices is not None:
+            for counter, choice in zip(self.choices, choices):
+                if choice is not None:
+                    counter[choice] += 1
+
+    def difficulty(self):
+        """Proportion of correct answers per item."""
+        return list(self.mean)
+
+    def point_biserial(self):
+        """Correlation between each item score and the total score (None if undefined)."""
+        result = []
+        for m2, co in zip(self.m2, self.co):
+            denom = math.sqrt(m2 * self.m2_total)
+            result.append(co / denom if denom > 0 else None)
+        return result
+
+    def distractors(self):
+        """Selection frequency (0..1) of every chosen option among the answered, per item."""
+        result = []
+        for counter in self.choices:
+            answered = sum(counter.values())
+            result.append({opt: cnt / answered for opt, cnt in counter.items()} if answered else {})
+        return result
+
+    def cronbach_alpha(self):
+        k = len(self.items)
+        if k < 2 or self.m2_total <= 0:
+            return None
+        # The 1/n of every variance cancels, so the sums of squares can be used directly
+        return k / (k - 1) * (1 - sum(self.m2) / self.m2_total)
+
+    def report(self):
+        lines = [f"Responses: {self.n}", f"Cronbach's alpha: {_fmt(self.cronbach_alpha())}"]
+        for name, p, r, dist in zip(self.items, self.difficulty(), self.point_biserial(), self.distractors()):
+            lines.append(f"{name}: difficulty={p:.3f} point-biserial={_fmt(r)}")
+            for opt, freq in sorted(dist.items(), key=lambda kv: -kv[1]):
+                lines.append(f"    {freq:6.1%}  {opt}")
+        return "\n".join(lines)
+
+
+def _fmt(value):
+    return "n/a" if value is None else f"{value:.3f}"
+
+
+def show_report(parent, analysis):
+    """Open a window with analysis.report() over its whole log (for the quiz GUIs' statistics button)."""
+    import tkinter as tk
+
+    analysis.load_history()
+    win = tk.Toplevel(parent)
+    win.title("Item Statistics")
+    text = tk.Text(win, wrap="none", font=("Courier", 11), width=100, height=40)
+    text.pack(fill="both", expand=True)
+    text.insert("end", analysis.report())
+    text.config(state="disabled")
+
+
+# ---------------- Response log ----------------
+def load_log(path, items):
+    """
+    Read the responses to items from a log written by ItemAnalysis.
+    Returns (scores, choices), one row per response. Entries recorded for another
+    item list (e.g. before the questions were edited) and unreadable lines, such
+    as a half-written last line, are skipped; a missing or unreadable file is empty.
+    """
+    items = list(items)
+    scores, choices = [], []
+    try:
+        f = open(path, encoding="utf-8")
+    except OSError:
+        return scores, choices
+    with f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                if entry["items"] != items or len(entry["scores"]) != len(items):
+                    continue
+                row_choices = entry["choices"] or [None] * len(items)
+                if len(row_choices) != len(items):
+                    continue
+            except (ValueError, KeyError, TypeError):
+                continue
+            scores.append(entry["scores"])
+            choices.append(row_choices)
+    return scores, choices
+
+
+# ---------------- Vectorized batch mode ----------------
+def batch_statistics(scores, choices=None):
+    """
+    Recompute the item statistics for a whole (responses x items) array of 0/1 scores.
+
+    choices, if given, has the same shape and holds the chosen options as recorded
+    by ItemAnalysis (option text, None for blank). Returns a dict with 'difficulty',
+    'point_biserial', 'alpha' and, with choices, 'distractors' in the same form as
+    ItemAnalysis.distractors().
+    """
+    import numpy as np  # only needed for batch mode
+
+    x = np.asarray(scores, dtype=np.float64)
+    k = x.shape[1]
+    total = x.sum(axis=1)
+    xc = x - x.mean(axis=0)
+    tc = total - total.mean()
+    m2 = np.einsum("ij,ij->j", xc, xc)
+    m2_total = tc @ tc
+    co = tc @ xc
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = co / np.sqrt(m2 * m2_total)
+    alpha = k / (k - 1) * (1 - m2.sum() / m2_total) if k > 1 and m2_total > 0 else float("nan")
+    stats = {"difficulty": x.mean(axis=0), "point_biserial": r, "alpha": alpha}
+
+    if choices is not None:
+        c = np.asarray(choices, dtype=object)
+        distractors = []
+        for j in range(k):
+            col = c[:, j]
+            col = col[col != None]  # noqa: E711 (elementwise on an object array)
+            if len(col) == 0:
+                distractors.append({})
+                continue
+            options, counts = np.unique(col.astype(str), return_counts=True)
+            distractors.append({opt: cnt / len(col) for opt, cnt in zip(options.tolist(), counts.tolist())})
+        stats["distractors"] = distractors
+    return stats
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+quiz_launcher.py
+
+One window hosting all three quizzes in tabs of a single Tk root:
+IEEE-754 quiz (FloatingPoint4), raw-bits quiz (vmac_Numbers) and MIPS quiz
+(Questionare_MultiChoice). A tab's module is imported and its GUI built only
+when the tab is first opened, so start-up only pays for Tk and the first tab.
+
+    python quiz_launcher.py                  # run
+    python quiz_launcher.py --startup-time   # measure cold start and exit
+    python quiz_launcher.py --pool quizzes.pool --pool raw_bits.pool
+
+--startup-time measures from the creation of the process (so interpreter
+start-up and, when frozen, the bootloader are included) until the first tab is
+drawn. The result is printed, written to --startup-file if given (the frozen
+build has no console), and the exit code is 1 if it is over STARTUP_BUDGET.
+"""
+
+import time
+
+_T0 = time.time()  # fallback start if the process creation time is unavailable
+
+import os
+import sys
+import argparse
+import importlib
+import tkinter as tk
+from tkinter import ttk
+
+STARTUP_BUDGET = 1.0  # seconds until the first tab is drawn
+
+def time_since_process_start():
+    """Seconds since this process was created, or None if the OS does not tell."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            times = [wintypes.FILETIME() for _ in range(4)]
+            kernel32 = ctypes.windll.kernel32
+            if not kernel32.GetProcessTimes(kernel32.GetCurrentProcess(), *map(ctypes.byref, times)):
+                return None
+            created = times[0].dwHighDateTime << 32 | times[0].dwLowDateTime
+            return time.time() - (created / 1e7 - 11644473600)  # FILETIME counts 100 ns from 1601
+        with open("/proc/self/stat") as f:
+            # Fields after the parenthesised command name; starttime (ticks after boot) is field 22
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+# (tab title, module, name of the callable that builds the quiz into a parent frame,
+#  kind of quiz pool it can be served from)
+TABS = [
+    ("IEEE-754 Quiz", "FloatingPoint4", "FloatQuizApp", "float"),
+    ("IEEE-754 Raw Bits", "vmac_Numbers", "build_ui", "vmac"),
+    ("MIPS Quiz", "Questionare_MultiChoice", "build_ui", None),
+]
+
+
+class QuizLauncher:
+    def __init__(self, root, pools=None):
+        """pools maps a pool kind to an open quiz_pool.QuizPool for the matching tab."""
+        self.root = root
+        self.pools = pools or {}
+        root.title("Quizzes")
+        root.geometry("1100x850")
+
+        self.notebook = ttk.Notebook(root)
+        self.notebook.pack(fill="both", expand=True)
+        self.tabs = {}
+        self.loaded = set()
+        for title, module, builder, pool_kind in TABS:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self.tabs[str(frame)] = (frame, module, builder, pool_kind)
+
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._load(self.notebook.select())
+
+    def _on_tab_changed(self, event=None):
+        self._load(self.notebook.select())
+
+    def _load(self, tab_id):
+        tab_id = str(tab_id)
+        if tab_id in self.loaded:
+            return
+        self.loaded.add(tab_id)
+        frame, module, builder, pool_kind = self.tabs[tab_id]
+        build = getattr(importlib.import_module(module), builder)
+        if pool_kind in self.pools:
+            build(frame, generate=self.pools[pool_kind].random_quiz)
+        else:
+            build(frame)
+
+
+def report_startup(path=None):
+    """Seconds since process creation; printed and, with path, written to a file."""
+    elapsed = time_since_process_start()
+    note = ""
+    if elapsed is None:
+        elapsed = time.time() - _T0
+        note = ", measured from launcher import"
+    line = f"Startup: {elapsed * 1000:.0f} ms (budget {STARTUP_BUDGET * 1000:.0f} ms{note})"
+    if sys.stdout is not None:  # None in the windowed frozen build
+        print(line)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(line + "\n")
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="All quizzes in one window.")
+    parser.add_argument("--startup-time", action="store_true",
+                        help="measure the time from process start to the first drawn tab, then exit")
+    parser.add_argument("--startup-file", help="also write the measurement to this file")
+    parser.add_argument("--pool", metavar="PATH", action="append", default=[],
+                        help="serve the matching tab from a quiz pool (see quiz_pool.py); repeatable")
+    args = parser.parse_args(argv)
+
+    pools = {}
+    if args.pool:
+        from quiz_pool import QuizPool
+        for path in args.pool:
+            try:
+                pool = QuizPool(path)
+            except (OSError, ValueError) as exc:
+                parser.error(str(exc))
+            pools[pool.kind] = pool
+
+    root = tk.Tk()
+    QuizLauncher(root, pools)
+    if args.startup_time:
+        root.update()  # draw the window and the first tab
+        elapsed = report_startup(args.startup_file)
+        root.destroy()
+        sys.exit(0 if elapsed <= STARTUP_BUDGET else 1)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Frozen build of quiz_launcher.py:  pyinstaller quiz_launcher.spec
+#
+# One-directory bundle (no unpacking to a temp dir on every start) without UPX
+# (no decompression on load). Modules go into the PYZ archive as precompiled
+# bytecode; optimize=1 compiles them as with "python -O".
+
+a = Analysis(
+    ['quiz_launcher.py'],
+    pathex=[],
+    # The quiz modules are imported by name when their tab is opened
+    hiddenimports=['FloatingPoint4', 'vmac_Numbers', 'Questionare_MultiChoice'],
+    # numpy is only used by item_analysis.batch_statistics, never by the GUIs
+    excludes=['numpy'],
+    optimize=1,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='quiz_launcher',
+    console=False,
+    upx=False,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    name='quiz_launcher',
+    upx=False,
+)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+quiz_pool.py
+
+Pre-generated quiz pool: one binary file of fixed-size records, each holding the
+operand bits of the three problems and their expected answers. Readers map the
+file with mmap, so any quiz is an O(1) read by index, nothing is parsed up front
+and all processes reading the same pool share its pages.
+
+    python quiz_pool.py build float quizzes.pool -n 1000000
+    python quiz_pool.py build vmac raw_bits.pool -n 1000000 --seed 1
+    python quiz_pool.py show quizzes.pool 42
+    python FloatingPoint4.py --pool quizzes.pool     # or vmac_Numbers.py / quiz_launcher.py
+
+Layout (little-endian):
+    header  magic "QUIZPOOL", kind (4 bytes), version, record size, record count
+    record  operand words: 1.1 value, A*B operands, A+B operands  (5 x uint32)
+            result words:  A*B, A+B                               (2 x uint32)
+            1.1 answer:    s (int8), d (uint8), e (int16), m (up to 6 ASCII digits)
+"""
+
+import sys
+import time
+import mmap
+import random
+import struct
+import argparse
+import importlib
+
+MAGIC = b"QUIZPOOL"
+VERSION = 1
+HEADER = struct.Struct("<8s4sIIQ4x")   # 32 bytes
+RECORD = struct.Struct("<7IbBh6s2x")   # 40 bytes
+CHUNK = 65536                          # records packed per write
+
+# kind name -> (tag in the header, generator module)
+KINDS = {
+    "float": (b"FP4\0", "FloatingPoint4"),
+    "vmac": (b"VMAC", "vmac_Numbers"),
+}
+
+
+# ---------------- Bit packing ----------------
+def to_word(s, E, F):
+    return (s & 1) << 31 | (E & 0xFF) << 23 | (F & 0x7FFFFF)
+
+
+def from_word(w):
+    return (w >> 31) & 1, (w >> 23) & 0xFF, w & 0x7FFFFF
+
+
+def _result_word(a, b, op):
+    A = struct.unpack('>f', struct.pack('>I', a))[0]
+    B = struct.unpack('>f', struct.pack('>I', b))[0]
+    return struct.unpack('>I', struct.pack('>f', A * B if op == "*" else A + B))[0]
+
+
+def _scientific(module, w):
+    """The 1.1 answer (s, d, m, e) exactly as the module's own quiz computes it."""
+    val = struct.unpack('>f', struct.pack('>I', w))[0]
+    if hasattr(module, "decimal_scientific_components"):
+        s, d, m, e, _ = module.decimal_scientific_components(val, 6)
+    else:
+        s, d, m, e = module.decimal_scientific(val)
+    return s, d, m[:6], e
+
+
+# ---------------- Building ----------------
+def build_pool(path, kind, count, seed=None):
+    """Write count quizzes from the kind's generator ('float' or 'vmac') to path."""
+    tag, module_name = KINDS[kind]
+    module = importlib.import_module(module_name)
+    if seed is not None:
+        random.seed(seed)
+
+    buf = bytearray(RECORD.size * min(count, CHUNK))
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, tag, VERSION, RECORD.size, count))
+        done = 0
+        while done < count:
+            n = min(CHUNK, count - done)
+            for i in range(n):
+                p1, p2, p3 = module.gen_quiz_operands()
+                w1 = to_word(*p1)
+                mA, mB = to_word(*p2[:3]), to_word(*p2[3:])
+                aA, aB = to_word(*p3[:3]), to_word(*p3[3:])
+                s, d, m, e = _scientific(module, w1)
+                RECORD.pack_into(buf, i * RECORD.size,
+                                 w1, mA, mB, aA, aB,
+                                 _result_word(mA, mB, "*"), _result_word(aA, aB, "+"),
+                                 s, d, e, m.encode("ascii"))
+            f.write(memoryview(buf)[:n * RECORD.size])
+            done += n
+
+
+# ---------------- Reading ----------------
+class QuizPool:
+    """
+    Read-only, memory-mapped view of a pool file. With kind ('float' or 'vmac'),
+    a pool of another kind is rejected.
+    """
+
+    def __init__(self, path, kind=None):
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mm) < HEADER.size:
+            self.mm.close()
+            raise ValueError(f"{path}: too short for a quiz pool header")
+        magic, tag, version, size, self.count = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION or size != RECORD.size:
+            self.mm.close()
+            raise ValueError(f"{path}: not a version {VERSION} quiz pool")
+        if len(self.mm) < HEADER.size + self.count * RECORD.size:
+            self.mm.close()
+            raise ValueError(f"{path}: truncated, expected {self.count} records")
+        kinds = [k for k, (t, _) in KINDS.items() if t == tag]
+        if not kinds or (kind is not None and kinds[0] != kind):
+            self.mm.close()
+            raise ValueError(f"{path}: pool kind {tag!r} is not {kind or 'a known kind'}")
+        self.kind = kinds[0]
+        self._fmt_E = str if self.kind == "float" else (lambda E: f"{E:08b}")
+
+    def __len__(self):
+        return self.count
+
+    def record(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(f"quiz {i} out of range (pool has {self.count})")
+        return RECORD.unpack_from(self.mm, HEADER.size + i * RECORD.size)
+
+    def operands(self, i):
+        """Operands of quiz i, in the same shape as the module's gen_quiz_operands()."""
+        w1, mA, mB, aA, aB = self.record(i)[:5]
+        return from_word(w1), from_word(mA) + from_word(mB), from_word(aA) + from_word(aB)
+
+    def answers(self, i):
+        """The 10 expected answer strings of quiz i, formatted as the kind's GUI grades them."""
+        rm, ra, s, d, e, m = self.record(i)[5:]
+        sR, ER, FR = from_word(rm)
+        sR2, ER2, FR2 = from_word(ra)
+        fmt_E = self._fmt_E
+        return [str(s), str(d), m.rstrip(b"\0").decode("ascii"), str(e),
+                str(sR), fmt_E(ER), f"{FR >> 17:06b}",
+                str(sR2), fmt_E(ER2), f"{FR2 >> 17:06b}"]
+
+    def quiz(self, i):
+        """
+        Quiz i, ready for its GUI: the stored answers plus labels formatted from the
+        operand words. Nothing is recomputed.
+        """
+        # The GUI module (and with it tkinter) is only needed to format a quiz;
+        # record/operands/answers work on hosts without it
+        module = importlib.import_module(KINDS[self.kind][1])
+        return module.quiz_from_answers(self.operands(i), self.answers(i))
+
+    def random_quiz(self):
+        """Drop-in replacement for the module's generate_quiz()."""
+        return self.quiz(random.randrange(self.count))
+
+    def close(self):
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------------- Command line ----------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or inspect a pre-generated quiz pool.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    b = sub.add_parser("build", help="generate a pool file")
+    b.add_argument("kind", choices=sorted(KINDS))
+    b.add_argument("path")
+    b.add_argument("-n", "--count", type=int, default=1000000)
+    b.add_argument("--seed", type=int)
+    s = sub.add_parser("show", help="print one quiz from a pool")
+    s.add_argument("path")
+    s.add_argument("index", type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        t0 = time.perf_counter()
+        build_pool(args.path, args.kind, args.count, args.seed)
+        size = HEADER.size + args.count * RECORD.size
+        print(f"Wrote {args.count} quizzes ({size / 1e6:.1f} MB) in {time.perf_counter() - t0:.1f} s")
+    else:
+        with QuizPool(args.path) as pool:
+            print(f"{args.path}: {pool.kind}, {len(pool)} quizzes")
+            print("operands:", pool.operands(args.index))
+            print("answers: ", pool.answers(args.index))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
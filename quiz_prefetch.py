@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+quiz_prefetch.py
+
+Background producer for the "New Quiz" buttons. A daemon worker thread keeps a
+small bounded queue of fully generated quizzes; the Tk thread only takes a ready
+quiz and applies it to the widgets, so clicking never waits for generation.
+"""
+
+import queue
+import logging
+import threading
+
+PREFETCH_DEPTH = 3  # ready quizzes kept in the queue
+POLL_MS = 10        # how often the Tk thread looks again if the queue is empty
+MAX_FAILURES = 100  # consecutive failed draws before the worker gives up
+
+log = logging.getLogger(__name__)
+
+
+class QuizPrefetcher:
+    """
+    produce() must build a complete quiz without touching Tk (it runs on the
+    worker thread). get() is called on the Tk thread and hands the next quiz
+    to apply() via root.after, polling instead of blocking the event loop.
+    """
+
+    def __init__(self, produce, depth=PREFETCH_DEPTH):
+        self.produce = produce
+        self.queue = queue.Queue(maxsize=depth)
+        self.error = None
+        self.worker = threading.Thread(target=self._fill, name="quiz-prefetch", daemon=True)
+        self.worker.start()
+
+    def _fill(self):
+        failures = 0
+        while True:
+            try:
+                quiz = self.produce()
+            except Exception as exc:
+                # A bad random draw only costs that quiz; keep filling the queue
+                failures += 1
+                log.exception("quiz generation failed (%d in a row)", failures)
+                if failures >= MAX_FAILURES:
+                    # Clearly not a bad draw: re-raised on the Tk thread by get()
+                    self.error = exc
+                    return
+                continue
+            failures = 0
+            self.queue.put(quiz)  # blocks while the queue is full
+
+    def get(self, root, apply):
+        try:
+            quiz = self.queue.get_nowait()
+        except queue.Empty:
+            if self.error is not None:
+                raise self.error
+            root.after(POLL_MS, self.get, root, apply)
+            return
+        root.after(0, apply, quiz)
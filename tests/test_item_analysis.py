@@ -0,0 +1,107 @@
+import random
+import statistics
+
+import pytest
+
+from item_analysis import ItemAnalysis, batch_statistics, load_log
+
+ITEMS = ["1", "2", "3", "4"]
+OPTIONS = ["Not at all", "One delay slot", "Two delay slots", "None of the alternatives"]
+
+
+def make_responses(n=300, seed=1):
+    rng = random.Random(seed)
+    scores, choices = [], []
+    for _ in range(n):
+        ability = rng.random()
+        scores.append([1 if rng.random() < ability else 0 for _ in ITEMS])
+        choices.append([rng.choice(OPTIONS + [None]) for _ in ITEMS])
+    return scores, choices
+
+
+def fill(analysis, scores, choices):
+    for sc, ch in zip(scores, choices):
+        analysis.record(sc, ch)
+    return analysis
+
+
+def test_streaming_matches_direct_computation():
+    scores, choices = make_responses()
+    a = fill(ItemAnalysis(ITEMS), scores, choices)
+    totals = [sum(row) for row in scores]
+    columns = list(zip(*scores))
+
+    assert a.difficulty() == pytest.approx([statistics.mean(c) for c in columns])
+    assert a.point_biserial() == pytest.approx([statistics.correlation(c, totals) for c in columns])
+    k = len(ITEMS)
+    alpha = k / (k - 1) * (1 - sum(statistics.pvariance(c) for c in columns) / statistics.pvariance(totals))
+    assert a.cronbach_alpha() == pytest.approx(alpha)
+
+
+def test_distractors_skip_blank_answers():
+    a = ItemAnalysis(["1"])
+    a.record([1], ["Not at all"])
+    a.record([0], ["One delay slot"])
+    a.record([0], [None])
+    assert a.distractors() == [{"Not at all": 0.5, "One delay slot": 0.5}]
+
+
+def test_log_is_replayed_on_demand(tmp_path):
+    path = tmp_path / "responses.jsonl"
+    scores, choices = make_responses(50)
+    live = fill(ItemAnalysis(ITEMS), scores, choices)
+    fill(ItemAnalysis(ITEMS, path), scores, choices)
+
+    assert load_log(path, ITEMS) == (scores, choices)
+
+    (new_scores,), (new_choices,) = make_responses(1, seed=2)
+    later = ItemAnalysis(ITEMS, path)
+    assert later.n == 0  # nothing is read until the statistics are asked for
+    later.record(new_scores, new_choices)
+    later.load_history()
+    assert later.n == 51
+    live.record(new_scores, new_choices)
+    assert later.point_biserial() == pytest.approx(live.point_biserial())
+    assert later.distractors() == live.distractors()
+
+
+def test_log_skips_other_items_and_bad_lines(tmp_path):
+    path = tmp_path / "responses.jsonl"
+    fill(ItemAnalysis(["1", "2"], path), [[1, 0]], [["a", "b"]])
+    fill(ItemAnalysis(ITEMS, path), [[1, 1, 0, 0]], [["a", "b", "c", None]])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"time": 1, "items": ["1", "2", "3", "4"], "sco')  # half-written line
+
+    assert load_log(path, ITEMS) == ([[1, 1, 0, 0]], [["a", "b", "c", None]])
+    assert load_log(path, ["1", "2"]) == ([[1, 0]], [["a", "b"]])
+    a = ItemAnalysis(ITEMS, path)
+    a.load_history()
+    assert a.n == 1
+
+
+def test_unwritable_log_keeps_response(tmp_path):
+    # The log's directory is a file, so the log cannot be created
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    a = ItemAnalysis(ITEMS, blocker / "responses.jsonl")
+    a.record([1, 0, 1, 0], ["a", None, "b", "c"])
+    a.load_history()
+    assert a.n == 1
+    assert a.difficulty() == [1, 0, 1, 0]
+
+
+def test_missing_log_is_empty(tmp_path):
+    assert load_log(tmp_path / "none.jsonl", ITEMS) == ([], [])
+
+
+def test_batch_matches_streaming():
+    pytest.importorskip("numpy")
+    scores, choices = make_responses()
+    a = fill(ItemAnalysis(ITEMS), scores, choices)
+    b = batch_statistics(scores, choices)
+
+    assert list(b["difficulty"]) == pytest.approx(a.difficulty())
+    assert list(b["point_biserial"]) == pytest.approx(a.point_biserial())
+    assert b["alpha"] == pytest.approx(a.cronbach_alpha())
+    for batch_dist, stream_dist in zip(b["distractors"], a.distractors()):
+        assert batch_dist == pytest.approx(stream_dist)
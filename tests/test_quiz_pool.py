@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import FloatingPoint4
+import vmac_Numbers
+import quiz_pool
+from quiz_pool import QuizPool, build_pool
+
+MODULES = {"float": FloatingPoint4, "vmac": vmac_Numbers}
+
+
+@pytest.fixture(params=sorted(MODULES))
+def pool_file(request, tmp_path):
+    path = tmp_path / f"{request.param}.pool"
+    build_pool(path, request.param, 2000, seed=7)
+    return request.param, path
+
+
+def test_round_trip_matches_build_quiz(pool_file):
+    kind, path = pool_file
+    module = MODULES[kind]
+    with QuizPool(path) as pool:
+        assert pool.kind == kind
+        assert len(pool) == 2000
+        for i in range(len(pool)):
+            expected = module.build_quiz(pool.operands(i))
+            assert pool.quiz(i) == expected
+            answers = expected["answers"] if kind == "float" else [v for t, v in expected if t == "entry"]
+            assert pool.answers(i) == answers
+
+
+def test_index_out_of_range(pool_file):
+    _, path = pool_file
+    with QuizPool(path) as pool:
+        with pytest.raises(IndexError):
+            pool.record(len(pool))
+
+
+def test_truncated_file_is_rejected(tmp_path):
+    path = tmp_path / "float.pool"
+    build_pool(path, "float", 10)
+    data = path.read_bytes()
+    path.write_bytes(data[:-quiz_pool.RECORD.size])
+    with pytest.raises(ValueError, match="truncated"):
+        QuizPool(path)
+
+
+def test_bad_magic_is_rejected(tmp_path):
+    path = tmp_path / "float.pool"
+    build_pool(path, "float", 10)
+    data = path.read_bytes()
+    path.write_bytes(b"NOTAPOOL" + data[8:])
+    with pytest.raises(ValueError, match="not a version"):
+        QuizPool(path)
+
+
+def test_unknown_or_wrong_kind_is_rejected(tmp_path):
+    path = tmp_path / "float.pool"
+    build_pool(path, "float", 10)
+    with pytest.raises(ValueError):
+        QuizPool(path, kind="vmac")
+    data = path.read_bytes()
+    path.write_bytes(data[:8] + b"XXXX" + data[12:])
+    with pytest.raises(ValueError):
+        QuizPool(path)
+
+
+def test_short_file_is_rejected(tmp_path):
+    path = tmp_path / "short.pool"
+    path.write_bytes(b"QUIZ")
+    with pytest.raises(ValueError):
+        QuizPool(path)
+
+
+def test_reading_does_not_import_gui_modules(tmp_path):
+    path = tmp_path / "float.pool"
+    build_pool(path, "float", 10)
+    code = (
+        "import sys, quiz_pool\n"
+        f"pool = quiz_pool.QuizPool({str(path)!r})\n"
+        "pool.record(0); pool.operands(0); pool.answers(9)\n"
+        "assert not {'tkinter', 'FloatingPoint4', 'vmac_Numbers'} & set(sys.modules), sorted(sys.modules)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
@@ -0,0 +1,50 @@
+import itertools
+import logging
+import time
+
+import pytest
+
+import quiz_prefetch
+from quiz_prefetch import QuizPrefetcher
+
+
+class FakeRoot:
+    """Runs root.after callbacks immediately (after sleeping the delay)."""
+
+    def after(self, ms, fn, *args):
+        time.sleep(ms / 1000)
+        fn(*args)
+
+
+def next_quiz(prefetcher):
+    got = []
+    prefetcher.get(FakeRoot(), got.append)
+    return got[0]
+
+
+def test_worker_survives_failed_draws(caplog):
+    counter = itertools.count()
+
+    def produce():
+        n = next(counter)
+        if n % 3 == 0:
+            raise OverflowError("float too large to pack with f format")
+        return n
+
+    with caplog.at_level(logging.ERROR, logger="quiz_prefetch"):
+        p = QuizPrefetcher(produce)
+        quizzes = [next_quiz(p) for _ in range(10)]
+    assert all(q % 3 for q in quizzes)
+    assert "quiz generation failed" in caplog.text
+
+
+def test_persistent_failure_is_raised(monkeypatch):
+    monkeypatch.setattr(quiz_prefetch, "MAX_FAILURES", 3)
+
+    def produce():
+        raise ValueError("broken generator")
+
+    p = QuizPrefetcher(produce)
+    p.worker.join(timeout=5)
+    with pytest.raises(ValueError):
+        p.get(FakeRoot(), print)
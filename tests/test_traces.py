@@ -0,0 +1,68 @@
+import re
+
+from FloatingPoint4 import build_quiz, trace_add, trace_multiply, trace_representation
+
+ONE = 0                      # 1.0
+HALF = 1 << 22               # 1.1 (1.5)
+THREE_QUARTERS = 3 << 21     # 1.11 (1.75)
+VALUE = (0, 127, ONE)        # section 1 operands, unused by the checks below
+
+
+def r_fields(trace):
+    """(S, E, left 6 bits of F) from the trace's final 'R:' line."""
+    last = trace.splitlines()[-1]
+    m = re.fullmatch(r"R: S = (\d), E = (\d+) = [01]{8}, F = [01]{23} → left 6 bits ([01]{6})", last)
+    assert m, last
+    return list(m.groups())
+
+
+def mul_answers(ops):
+    return build_quiz((VALUE, ops, ops))["answers"][4:7]
+
+
+def add_answers(ops):
+    return build_quiz((VALUE, ops, ops))["answers"][7:10]
+
+
+def test_add_exact_cancellation_is_positive_zero():
+    ops = (1, 128, ONE, 0, 128, ONE)
+    trace = trace_add(*ops)
+    assert "S = SA" not in trace and "S = SB" not in trace
+    assert "exactly zero, +0" in trace
+    assert r_fields(trace) == add_answers(ops) == ["0", "0", "000000"]
+
+
+def test_add_aligns_smaller_exponent_right():
+    ops = (0, 128, HALF, 0, 127, HALF)  # 3 + 1.5
+    trace = trace_add(*ops)
+    assert "shift B's significand right 1: 1.1 → 0.11" in trace
+    assert "Signs equal → add: 1.1 + 0.11 = 10.01" in trace
+    assert "shift right 1 → 1.001, E = 128 + 1 = 129" in trace
+    assert r_fields(trace) == add_answers(ops)
+
+
+def test_add_normalizes_left_after_subtraction():
+    ops = (0, 128, HALF, 1, 127, THREE_QUARTERS)  # 3 - 1.75
+    trace = trace_add(*ops)
+    assert "1.1 - 0.111 = 0.101, S = SA = 0" in trace
+    assert "shift left 1 → 1.01, E = 128 - 1 = 127" in trace
+    assert r_fields(trace) == add_answers(ops)
+
+
+def test_multiply_product_at_least_two_shifts_right():
+    ops = (0, 127, THREE_QUARTERS, 1, 128, HALF)  # 1.75 * -3
+    trace = trace_multiply(*ops)
+    assert "S = SA xor SB = 0 xor 1 = 1" in trace
+    assert "EA + EB - 127 = 127 + 128 - 127 = 128" in trace
+    assert "1.11 * 1.1 = 10.101" in trace
+    assert "shift right 1 → 1.0101, E = 128 + 1 = 129" in trace
+    assert r_fields(trace) == mul_answers(ops)
+
+
+def test_representation_matches_answers():
+    s, d, m, e = build_quiz(((1, 126, THREE_QUARTERS), (0,) * 6, (0,) * 6))["answers"][:4]
+    trace = trace_representation(1, 126, THREE_QUARTERS)
+    assert "1.F = 1.11 = 1 + 2^-1 + 2^-2 = 1.75" in trace
+    assert "Exponent: E - 127 = 126 - 127 = -1" in trace
+    sign = "-" if s == "-1" else "+"
+    assert trace.splitlines()[-1] == f"Scientific: {sign}{d}.{m}e{int(e):+d}"
@@ -4,11 +4,14 @@ import struct
 import random
 from decimal import Decimal, getcontext
 
+from quiz_prefetch import QuizPrefetcher
+
 getcontext().prec = 40  # precision for decimal conversion
 
 # Track entries and correct values
 entries = []
 correct = []
+prefetcher = None  # created by build_ui
 
 
 # ===== IEEE Utility Functions =====
@@ -66,75 +69,134 @@ def add_entry(answer, width=6):
 
 
 # ===== Generate Quiz =====
-def make_quiz():
-    entries.clear()
-    correct.clear()
-    text.delete("1.0", "end")
+def gen_quiz_operands():
+    """Random operand bits: (s, E, F), (sA, EA, FA, sB, EB, FB) to multiply and to add."""
+    p1 = (rand_sign(), rand_exp(), rand_frac())
+    # Redraw until A*B fits in single precision (struct.pack('>f') raises on overflow)
+    while True:
+        p2 = (rand_sign(), rand_exp(), rand_frac(), rand_sign(), rand_exp(), rand_frac())
+        try:
+            struct.pack('>f', bits_to_float32(*p2[:3]) * bits_to_float32(*p2[3:]))
+            break
+        except OverflowError:
+            pass
+    EA2 = rand_exp()
+    EB2 = max(2, min(253, EA2 + random.choice([-1, 0, 1])))
+    sA2, FA2 = rand_sign(), rand_frac()
+    sB2, FB2 = rand_sign(), rand_frac()
+    p3 = (sA2, EA2, FA2, sB2, EB2, FB2)
+    return p1, p2, p3
+
 
-    text.insert("end", "IEEE-754 Float Quiz\n\n")
-    text.insert("end", "Answer format: match sign, exponent, mantissa fields.\n\n")
+def build_quiz(operands):
+    """
+    Quiz content as a list of ("text", str) and ("entry", answer) parts, in the
+    order they go into the Text widget. Does not touch Tk, so it can run on the
+    prefetch worker.
+    """
+    (s, E, F), (sA, EA, FA, sB, EB, FB), (sA2, EA2, FA2, sB2, EB2, FB2) = operands
 
     # ---- Problem 1 ----
-    s = rand_sign()
-    E = rand_exp()
-    F = rand_frac()
     val = bits_to_float32(s, E, F)
     s2, d, m, e10 = decimal_scientific(val)
 
-    text.insert("end", "1. Convert IEEE-754 to Decimal Scientific:\n")
-    text.insert("end", f"S={s}, E={E:08b}, F={F:023b}\n")
-
-    text.insert("end", "Enter: s = ")
-    add_entry(s2)
-    text.insert("end", ", d = ")
-    add_entry(d)
-    text.insert("end", ", m(first 6 digits) = ")
-    add_entry(m[:6])
-    text.insert("end", ", e = ")
-    add_entry(e10)
-    text.insert("end", "\n\n")
-
     # ---- Problem 2 Multiply ----
-    sA, EA, FA = rand_sign(), rand_exp(), rand_frac()
-    sB, EB, FB = rand_sign(), rand_exp(), rand_frac()
     A = bits_to_float32(sA, EA, FA)
     B = bits_to_float32(sB, EB, FB)
     R = struct.unpack('>f', struct.pack('>f', A * B))[0]
     sR, ER, FR = float32_to_bits(R)
 
-    text.insert("end", "2. Multiply (A*B):\n")
-    text.insert("end", f"A: S={sA} E={EA:08b} F={FA:023b}\n")
-    text.insert("end", f"B: S={sB} E={EB:08b} F={FB:023b}\n")
-
-    text.insert("end", "R: S = ")
-    add_entry(sR)
-    text.insert("end", ", E(8-bit) = ")
-    add_entry(f"{ER:08b}")
-    text.insert("end", ", F(left 6 bits) = ")
-    add_entry(leftmost_bits(FR, 6))
-    text.insert("end", "\n\n")
-
     # ---- Problem 3 Add ----
-    EA2 = rand_exp()
-    EB2 = max(2, min(253, EA2 + random.choice([-1, 0, 1])))
-    sA2, FA2 = rand_sign(), rand_frac()
-    sB2, FB2 = rand_sign(), rand_frac()
     A2 = bits_to_float32(sA2, EA2, FA2)
     B2 = bits_to_float32(sB2, EB2, FB2)
     R2 = struct.unpack('>f', struct.pack('>f', A2 + B2))[0]
     sR2, ER2, FR2 = float32_to_bits(R2)
 
-    text.insert("end", "3. Add (A+B):\n")
-    text.insert("end", f"A: S={sA2} E={EA2:08b} F={FA2:023b}\n")
-    text.insert("end", f"B: S={sB2} E={EB2:08b} F={FB2:023b}\n")
+    return quiz_from_answers(operands, [
+        s2, d, m[:6], e10,
+        sR, f"{ER:08b}", leftmost_bits(FR, 6),
+        sR2, f"{ER2:08b}", leftmost_bits(FR2, 6),
+    ])
+
+
+def quiz_from_answers(operands, answers):
+    """The parts list from operands and already known answers (formatting only, e.g. from quiz_pool)."""
+    parts = []
+    answers = iter(answers)
+
+    def put(t):
+        parts.append(("text", t))
+
+    def ask():
+        parts.append(("entry", str(next(answers))))
+
+    (s, E, F), (sA, EA, FA, sB, EB, FB), (sA2, EA2, FA2, sB2, EB2, FB2) = operands
+
+    put("IEEE-754 Float Quiz\n\n")
+    put("Answer format: match sign, exponent, mantissa fields.\n\n")
+
+    # ---- Problem 1 ----
+    put("1. Convert IEEE-754 to Decimal Scientific:\n")
+    put(f"S={s}, E={E:08b}, F={F:023b}\n")
+
+    put("Enter: s = ")
+    ask()
+    put(", d = ")
+    ask()
+    put(", m(first 6 digits) = ")
+    ask()
+    put(", e = ")
+    ask()
+    put("\n\n")
+
+    # ---- Problem 2 Multiply ----
+    put("2. Multiply (A*B):\n")
+    put(f"A: S={sA} E={EA:08b} F={FA:023b}\n")
+    put(f"B: S={sB} E={EB:08b} F={FB:023b}\n")
+
+    put("R: S = ")
+    ask()
+    put(", E(8-bit) = ")
+    ask()
+    put(", F(left 6 bits) = ")
+    ask()
+    put("\n\n")
+
+    # ---- Problem 3 Add ----
+    put("3. Add (A+B):\n")
+    put(f"A: S={sA2} E={EA2:08b} F={FA2:023b}\n")
+    put(f"B: S={sB2} E={EB2:08b} F={FB2:023b}\n")
+
+    put("R: S = ")
+    ask()
+    put(", E(8-bit) = ")
+    ask()
+    put(", F(left 6 bits) = ")
+    ask()
+    put("\n\n")
+
+    return parts
+
+
+def generate_quiz():
+    return build_quiz(gen_quiz_operands())
+
+
+def make_quiz():
+    # Generation runs on the prefetch worker; here we only apply the result
+    prefetcher.get(text, apply_quiz)
+
+
+def apply_quiz(parts):
+    entries.clear()
+    correct.clear()
+    text.delete("1.0", "end")
 
-    text.insert("end", "R: S = ")
-    add_entry(sR2)
-    text.insert("end", ", E(8-bit) = ")
-    add_entry(f"{ER2:08b}")
-    text.insert("end", ", F(left 6 bits) = ")
-    add_entry(leftmost_bits(FR2, 6))
-    text.insert("end", "\n\n")
+    for kind, value in parts:
+        if kind == "entry":
+            add_entry(value)
+        else:
+            text.insert("end", value)
 
     result_label.config(text="")
 
@@ -152,37 +214,57 @@ def check_answers():
 
 
 # ===== UI Layout =====
-root = tk.Tk()
-root.title("IEEE-754 Floating Point Quiz")
-root.geometry("1100x850")
-
-main = ttk.Frame(root)
-main.pack(fill="both", expand=True)
-
-canvas = tk.Canvas(main)
-scrollbar = ttk.Scrollbar(main, orient="vertical", command=canvas.yview)
-frame = ttk.Frame(canvas)
-canvas.create_window((0, 0), window=frame, anchor="nw")
-canvas.configure(yscrollcommand=scrollbar.set)
-canvas.pack(side="left", fill="both", expand=True)
-scrollbar.pack(side="right", fill="y")
-
-text = tk.Text(frame, wrap="word", font=("Arial", 12), width=130)
-text.pack(fill="both", expand=True, padx=10, pady=10)
-
-btn_frame = ttk.Frame(frame)
-btn_frame.pack(pady=10)
-
-ttk.Button(btn_frame, text="✅ Check Answers", command=check_answers).pack(side="left", padx=10)
-ttk.Button(btn_frame, text="🔄 New Quiz", command=make_quiz).pack(side="left", padx=10)
-
-result_label = ttk.Label(frame, font=("Arial", 14, "bold"))
-result_label.pack(pady=10)
-
-def update_scroll(event=None):
-    canvas.configure(scrollregion=canvas.bbox("all"))
-
-frame.bind("<Configure>", update_scroll)
-
-make_quiz()
-root.mainloop()
+def build_ui(parent, generate=generate_quiz):
+    """
+    Build the quiz inside parent (a Tk root or a launcher tab) and show the first quiz.
+    generate() returns the next quiz, e.g. quiz_pool.QuizPool(path).random_quiz.
+    """
+    global text, result_label, prefetcher
+
+    prefetcher = QuizPrefetcher(generate)
+
+    main = ttk.Frame(parent)
+    main.pack(fill="both", expand=True)
+
+    canvas = tk.Canvas(main)
+    scrollbar = ttk.Scrollbar(main, orient="vertical", command=canvas.yview)
+    frame = ttk.Frame(canvas)
+    canvas.create_window((0, 0), window=frame, anchor="nw")
+    canvas.configure(yscrollcommand=scrollbar.set)
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+
+    text = tk.Text(frame, wrap="word", font=("Arial", 12), width=130)
+    text.pack(fill="both", expand=True, padx=10, pady=10)
+
+    btn_frame = ttk.Frame(frame)
+    btn_frame.pack(pady=10)
+
+    ttk.Button(btn_frame, text="✅ Check Answers", command=check_answers).pack(side="left", padx=10)
+    ttk.Button(btn_frame, text="🔄 New Quiz", command=make_quiz).pack(side="left", padx=10)
+
+    result_label = ttk.Label(frame, font=("Arial", 14, "bold"))
+    result_label.pack(pady=10)
+
+    def update_scroll(event=None):
+        canvas.configure(scrollregion=canvas.bbox("all"))
+
+    frame.bind("<Configure>", update_scroll)
+
+    make_quiz()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="IEEE-754 raw bits quiz.")
+    parser.add_argument("--pool", metavar="PATH", help="serve quizzes from a 'vmac' quiz pool (see quiz_pool.py)")
+    args = parser.parse_args()
+    generate = generate_quiz
+    if args.pool:
+        from quiz_pool import QuizPool
+        generate = QuizPool(args.pool, kind="vmac").random_quiz
+    root = tk.Tk()
+    root.title("IEEE-754 Floating Point Quiz")
+    root.geometry("1100x850")
+    build_ui(root, generate=generate)
+    root.mainloop()